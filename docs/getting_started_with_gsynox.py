@@ -72,7 +72,7 @@ g.ensembl_gene_to_symbol(ens)
 g.ensembl_gene_to_symbol(ens, all_synonyms=True)
 
 
-# This functionality also works when the user provides more than ID for translation, providing as a results a list of lists.
+# This functionality also works when the user provides more than ID for translation, providing as a results a list of tuples.
 
 # In[77]:
 
@@ -4,8 +4,19 @@
 import pandas as pd
 import pickle
 import datetime
-import numpy as np
+import os
 import re
+import sys
+
+
+_SAFE_RE = re.compile('_id(.)*')
+
+# Use the multithreaded pyarrow CSV parser when available
+try:
+    import pyarrow  # noqa: F401
+    _CSV_ENGINE = "pyarrow"
+except ImportError:
+    _CSV_ENGINE = "c"
 
 
 class Builder:
@@ -15,7 +26,8 @@ class Builder:
     Attributes:
     -----------
     master : dict
-        A dictionary containing the database mappings.
+        A dictionary containing the database mappings. Synonyms and all-symbols entries are stored 
+        as tuples, which may be shared between entries.
     """
     
     master = {}
@@ -34,7 +46,26 @@ class Builder:
             str: 
                 The cleaned string.
         """
-        return re.sub('_id(.)*', '', x).strip()
+        return _SAFE_RE.sub('', x).strip()
+
+    def __split(self, column: pd.Series, sep: str) -> list:
+        """
+        Splits every value of a column on a separator, mapping empty values to empty lists.
+        The resulting strings are interned so that every dictionary in `master` shares them.
+
+        Parameters:
+        -----------
+            column : pd.Series
+                The string column to split.
+            sep : str
+                The separator between values.
+
+        Returns:
+        --------
+            list:
+                A list with the split values of each row.
+        """
+        return [[sys.intern(v) for v in values] if values != [""] else [] for values in column.str.split(sep, regex=False).tolist()]
 
     def build(self, hgnc_file: str, key_symbol="symbol", alias_field="alias_symbol", prev_field="prev_symbol", fields=None) -> None:
         """
@@ -58,9 +89,10 @@ class Builder:
             None
         """
         fields = fields or ["ensembl_gene_id", "entrez_id", "hgnc_id"]
+        safe_fields = {f: self.__safe(f) for f in fields}
 
         # Load raw file
-        hgnc = pd.read_csv(hgnc_file, sep="\t", dtype="str")
+        hgnc = pd.read_csv(hgnc_file, sep="\t", dtype="str", engine=_CSV_ENGINE, usecols=list(dict.fromkeys([key_symbol, alias_field, prev_field] + fields)))
         hgnc = hgnc.fillna("")
         
         # Initialize master dictionary
@@ -69,12 +101,12 @@ class Builder:
         self.master["info"] = {
             "version": 0.1,
             "date": x.strftime("%c"),
-            "dbs": [key_symbol] + list(map(self.__safe, fields)),
+            "dbs": [key_symbol] + [safe_fields[f] for f in fields],
             "log": [],
         }
         self.master["symbol"] = {"official": {}, "synonyms": {}}
         for f in fields:
-            self.master[self.safe(f)] = {
+            self.master[safe_fields[f]] = {
                 "id_to_symbol": {},
                 "id_to_all_symbols": {},
                 "symbol_to_id": {},
@@ -82,34 +114,31 @@ class Builder:
 
         # Fill master
         n = hgnc.shape[0]
-        official_symbols = hgnc[["symbol"]].values
+        symbols = [sys.intern(s) for s in hgnc[key_symbol].tolist()]
+        official_symbols = set(symbols)
+        alias_lists = self.__split(hgnc[alias_field], "|")
+        prev_lists = self.__split(hgnc[prev_field], "|")
+        id_lists = [self.__split(hgnc[f], "|") for f in fields]
+        canonical_synonyms = {}
         step = 1000
-        for i in range(n):
+        for i, (symbol, alias_symbols, prev_symbols, *row_ids) in enumerate(zip(symbols, alias_lists, prev_lists, *id_lists)):
             if (i % step) == 0:
                 print(i, " of ", n)
 
-            symbol = hgnc.loc[i, key_symbol]
-            # Extract alias symbols
-            raw_alias_symbol = hgnc.loc[i, alias_field]
-            alias_symbols = raw_alias_symbol.split("|") if raw_alias_symbol else []
-
-            # Extract previous symbols
-            raw_prev_symbol = hgnc.loc[i, prev_field]
-            prev_symbols = raw_prev_symbol.split("|") if raw_prev_symbol else []
+            # Identical synonym tuples (most often empty) are shared between genes
+            synonyms = tuple(sorted(set(alias_symbols + prev_symbols)))
+            synonyms = canonical_synonyms.setdefault(synonyms, synonyms)
+            all_symbols = (symbol, *synonyms)
 
-            synonyms = np.unique(alias_symbols + prev_symbols).tolist()
-
-            for f in fields:
-                raw = hgnc.loc[i, f]
-                if raw:
-                    ids = raw.split("|")
+            for f, ids in zip(fields, row_ids):
+                if ids:
                     for u in ids:
-                        self.master[self.safe(f)]["id_to_symbol"][u] = symbol
-                        self.master[self.safe(f)]["id_to_all_symbols"][u] = [symbol] + synonyms
-                    self.master[self.safe(f)]["symbol_to_id"][symbol] = ids
+                        self.master[safe_fields[f]]["id_to_symbol"][u] = symbol
+                        self.master[safe_fields[f]]["id_to_all_symbols"][u] = all_symbols
+                    self.master[safe_fields[f]]["symbol_to_id"][symbol] = ids
                     for s in synonyms:
                         if s and s not in official_symbols:
-                            self.master[self.safe(f)]["symbol_to_id"][s] = ids
+                            self.master[safe_fields[f]]["symbol_to_id"][s] = ids
 
             self.master["symbol"]["official"][symbol] = symbol
             for s in synonyms:
@@ -119,7 +148,7 @@ class Builder:
 
     def save(self, output_file: str) -> None:
         """
-        Saves the `master` dictionary to a pickle file.
+        Saves the `master` dictionary to a pickle file, using the highest pickle protocol.
 
         Parameters:
         -----------
@@ -131,7 +160,26 @@ class Builder:
             None
         """
         with open(output_file, "wb") as outfile:
-            pickle.dump(self.master, outfile)
+            pickle.dump(dict(self.master), outfile, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def save_sections(self, output_dir: str) -> None:
+        """
+        Saves every section of the `master` dictionary (e.g. 'info', 'symbol', 'ensembl_gene') 
+        to its own pickle file, so that GSynoX can load each one only when it is used.
+
+        Parameters:
+        -----------
+            output_dir : str
+                Path to the output directory. It is created if it does not exist.
+
+        Returns:
+        --------
+            None
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        for key, section in self.master.items():
+            with open(os.path.join(output_dir, f"{key}.pkl"), "wb") as outfile:
+                pickle.dump(section, outfile, protocol=pickle.HIGHEST_PROTOCOL)
 
     def add_db(self, db_file: str, name: str) -> None:
         """
@@ -150,24 +198,32 @@ class Builder:
         """
         self.master[name] = {"id_to_symbol": {}, "id_to_all_symbols": {}, "symbol_to_id": {}}
         x = datetime.datetime.now()
-        self.master["info"]["log"].append(f"Added {name} on {x.strftime('%c')}")
-        self.master["info"]["dbs"].append(name)
+        # Replace info instead of editing it, as GSynoX objects may share it (see GSynoX.master)
+        info = dict(self.master["info"])
+        info["log"] = info["log"] + [f"Added {name} on {x.strftime('%c')}"]
+        info["dbs"] = info["dbs"] + [name]
+        self.master["info"] = info
 
         # Load data
-        db = pd.read_csv(db_file, sep="\t", dtype="str")
+        db = pd.read_csv(db_file, sep="\t", dtype="str", engine=_CSV_ENGINE)
         db = db.fillna("")
 
-        for i in range(db.shape[0]):
-            symbol = db.iloc[i, 0]
-            osymbol = self.master["symbol"]["official"][symbol]
-            synonyms = self.master["symbol"]["synonyms"][osymbol]
-
-            raw_ids = db.iloc[i, 1]
-            if raw_ids:
-                ids = raw_ids.split(",")
-                self.master[name]["symbol_to_id"][osymbol] = ids
+        symbols = db.iloc[:, 0].tolist()
+        id_lists = self.__split(db.iloc[:, 1], ",")
+        official = self.master["symbol"]["official"]
+        all_synonyms = self.master["symbol"]["synonyms"]
+        symbol_to_id = self.master[name]["symbol_to_id"]
+        id_to_symbol = self.master[name]["id_to_symbol"]
+        id_to_all_symbols = self.master[name]["id_to_all_symbols"]
+        for symbol, ids in zip(symbols, id_lists):
+            osymbol = official[symbol]
+            synonyms = all_synonyms[osymbol]
+
+            if ids:
+                all_symbols = (osymbol, *synonyms)
+                symbol_to_id[osymbol] = ids
                 for s in synonyms:
-                    self.master[name]["symbol_to_id"][s] = ids
+                    symbol_to_id[s] = ids
                 for id in ids:
-                    self.master[name]["id_to_symbol"][id] = osymbol
-                    self.master[name]["id_to_all_symbols"][id] = [osymbol] + synonyms
+                    id_to_symbol[id] = osymbol
+                    id_to_all_symbols[id] = all_symbols
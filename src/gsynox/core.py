@@ -1,10 +1,134 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import functools
+import itertools
 import pickle
 import numpy as np
 # import pkg_resources
 import os
+import sys
+from collections.abc import MutableMapping
+
+
+_NOT_LOADED = object()
+
+
+@functools.lru_cache(maxsize=16)
+def _load_pickle(path:str, mtime_ns:int, size:int) -> dict:
+    """
+    Load a pickle file, caching the result by path, modification time and size, so that a 
+    rewritten file is read again.
+    
+    The loaded object is shared by every caller, so it must be replaced rather than modified.
+
+    Parameters:
+    -----------
+    path : str
+        Absolute path to the pickle file.
+    mtime_ns : int
+        Modification time of the file, in nanoseconds.
+    size : int
+        Size of the file, in bytes.
+
+    Returns:
+    --------
+    dict
+        The unpickled object.
+    """
+    
+    with open(path, "rb", buffering=1 << 20) as g:
+        return pickle.load(g)
+
+
+def _read_pickle(path:str, cache=True) -> dict:
+    """
+    Load a pickle file, through the cache of `_load_pickle` unless disabled.
+
+    Parameters:
+    -----------
+    path : str
+        Absolute path to the pickle file.
+    cache : bool, optional
+        If False, always reads the file and returns a new object (default is True).
+
+    Returns:
+    --------
+    dict
+        The unpickled object.
+    """
+    
+    if cache is False:
+        with open(path, "rb", buffering=1 << 20) as g:
+            return pickle.load(g)
+    
+    stat = os.stat(path)
+    return _load_pickle(path, stat.st_mtime_ns, stat.st_size)
+
+
+class LazyMaster(MutableMapping):
+    """
+    A master database split in one pickle file per section (e.g. 'info.pkl', 'symbol.pkl', 
+    'ensembl_gene.pkl'), where every section is loaded on first access.
+    
+    Attributes:
+    -----------
+    master_dir : str
+        Path to the directory containing the section files.
+    cache : bool
+        Whether sections are loaded through the cache shared by GSynoX objects.
+    """
+    
+    def __init__(self, master_dir:str, cache=True):
+        """
+        Initialize the LazyMaster object.
+
+        Parameters:
+        -----------
+        master_dir : str
+            Path to the directory containing the section files.
+        cache : bool, optional
+            If False, sections are read from disk instead of from the cache shared by 
+            GSynoX objects (default is True).
+        """
+        
+        self.master_dir = master_dir
+        self.cache = cache
+        names = sorted(name[:-len(".pkl")] for name in os.listdir(master_dir) if name.endswith(".pkl"))
+        self.__sections = dict.fromkeys(names, _NOT_LOADED)
+        
+        # keep the original section order, as listed in info
+        if "info" in self.__sections:
+            order = ["info"] + [db for db in self["info"]["dbs"] if db in self.__sections] + names
+            self.__sections = {key: self.__sections[key] for key in dict.fromkeys(order)}
+    
+    
+    def __getitem__(self, key:str) -> dict:
+        section = self.__sections[key]
+        if section is _NOT_LOADED:
+            section = self.__sections[key] = _read_pickle(os.path.join(self.master_dir, key + ".pkl"), cache=self.cache)
+        return section
+    
+    
+    def __contains__(self, key:str) -> bool:
+        return key in self.__sections
+    
+    
+    def __setitem__(self, key:str, section:dict) -> None:
+        self.__sections[key] = section
+    
+    
+    def __delitem__(self, key:str) -> None:
+        del self.__sections[key]
+    
+    
+    def __iter__(self):
+        return iter(self.__sections)
+    
+    
+    def __len__(self) -> int:
+        return len(self.__sections)
+
 
 class GSynoX():
     """
@@ -12,39 +136,63 @@ class GSynoX():
     
     Attributes:
     -----------
-    master : dict
-        A dictionary containing the database mappings.
+    master : dict | LazyMaster
+        A dictionary containing the database mappings. Each object has its own top-level mapping, 
+        but unless created with `cache=False`, its sections (e.g. master["symbol"]) are shared 
+        with every GSynoX object loaded from the same unchanged file. Sections should therefore 
+        be replaced rather than modified in place.
     default_null_id : Any
         The default return value for missing translations.
     """
 
     master = {}
     default_null_id = None
+    __random_pool = None
     
-    def __init__(self, master_file=None, init_empty=False):
+    def __init__(self, master_file=None, init_empty=False, cache=True):
         """
         Initialize the GSynox object.
 
         Parameters:
         -----------
         master_file : str, optional
-            Path to the master database file (default is None).
+            Path to the master database file, or to a directory with one file per section 
+            as written by `Builder.save_sections` (default is None).
         init_empty : bool, optional
             If True, initializes an empty master database (default is False).
+        cache : bool, optional
+            If True, reuses the sections already loaded by other GSynoX objects from the same 
+            unchanged file. If False, reads a private copy from disk (default is True).
         """
         
         if init_empty is False:
             if master_file is None:
-                master_file = os.path.abspath(os.path.dirname(__file__) + '/resources/master.pkl')
+                master_file = os.path.abspath(os.path.dirname(__file__) + '/resources/master')
                 print("Using internal database " + master_file)
             
-            with open(master_file, "rb") as g:
-                self.master = pickle.load(g)
+            # every object gets its own top-level mapping over the (possibly cached) sections
+            master_file = os.path.abspath(master_file)
+            if os.path.isdir(master_file):
+                self.master = LazyMaster(master_file, cache=cache)
+            else:
+                self.master = dict(_read_pickle(master_file, cache=cache))
+
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Clear the cache of loaded master database files, so that they are read again from disk.
+        """
+        
+        _load_pickle.cache_clear()
 
     
     def __translate(self, ids:list, db:str, domain:str, select_one=False, preferred_ids=[]) -> list:
         """
         Translate a list of IDs to/from a given database.
+        
+        A pandas Series or numpy array of IDs is translated with `translate_many` and returns a
+        Series or array of the same length, even with a single ID.
           
         Parameters:
         -----------
@@ -62,22 +210,29 @@ class GSynoX():
         Returns:
         --------
         list
-            A list of translated IDs.
+            A list of translated IDs. Multiple translated IDs are a list, and synonyms are a tuple.
         """
                 
+        table = self.master[db][domain]
+        null = self.default_null_id
+        
+        # fast path for a single id
+        if isinstance(ids, str) and len(preferred_ids) == 0:
+            tx = table.get(ids, null)
+            return self.__select_first(tx) if select_one is True else tx
+        
+        # keep batches aligned with their input (ids can only be a Series if pandas is loaded)
+        pd = sys.modules.get("pandas")
+        is_series = pd is not None and isinstance(ids, pd.Series)
+        if is_series or isinstance(ids, np.ndarray):
+            tx = self.translate_many(ids, db, domain, select_one=select_one, preferred_ids=preferred_ids)
+            return tx if is_series else tx.to_numpy()
+        
         # prepare ids
         if isinstance(ids, str):
             ids = [ids]
         
-        # translate
-        if len(preferred_ids) == 0:
-            tx = list(map(lambda id: self.__translate_id(id, db, domain), ids))
-        else:
-            tx = list(map(lambda id: self.__translate_preferred_id(id, db, domain, preferred_ids), ids))
-        
-        # select
-        if select_one is True:
-            tx = list(map(lambda x: self.__select_first(x), tx))
+        tx = self.__translate_all(ids, table, select_one=select_one, preferred_ids=preferred_ids)
         
         if len(tx)==1:
             tx = tx[0]
@@ -85,44 +240,54 @@ class GSynoX():
         return tx
         
         
-    def __translate_id(self, id:str, db:str, domain:str) -> list:
+    def __translate_all(self, ids:list, table:dict, select_one=False, preferred_ids=[]) -> list:
         """
-        Translate a single ID to/from a given database.
-
+        Translate every ID of an iterable with a given translation table.
+          
         Parameters:
         -----------
-        id : str
-            The ID to be translated.
-        db : str
-            External database name involved in the translation.
-        domain : str
-            Defines the translation direction (e.g., 'symbol_to_id', 'id_to_symbol').
-
+        ids : list
+            Iterable of IDs to be translated.
+        table : dict
+            The translation table of the database and domain involved.
+        select_one : bool, optional
+            If True, selects the first translation result (default is False).
+        preferred_ids : list, optional
+            A list of IDs to prioritize during translation (default is empty).
+          
         Returns:
         --------
         list
-            A list of translated IDs or the default null ID if not found.
+            A list of translated IDs, one per input ID. Multiple translated IDs are a list, and synonyms are a tuple.
         """
         
-        if id in self.master[db][domain]:
-            return self.master[db][domain][id]
+        # translate
+        if len(preferred_ids) == 0:
+            tx = list(map(table.get, ids, itertools.repeat(self.default_null_id)))
         else:
-            return self.default_null_id
+            preferred_ids = set(preferred_ids)
+            tx = [self.__translate_preferred_id(id, table, preferred_ids) for id in ids]
+        
+        # select
+        if select_one is True:
+            tx = [self.__select_first(x) for x in tx]
+        
+        return tx
         
         
-    def __select_first(self, x:list) -> str:
+    def __select_first(self, x:list | tuple) -> str:
         """
-        Select the first element of a list, if available.
+        Select the first element of a list or tuple, if available.
         
         Parameters:
         -----------
-        x : list
-            A list of IDs or None.
+        x : list | tuple
+            A list or tuple of IDs, or None.
         
         Returns:
         --------
         str
-            The first element of the list or the default null ID.
+            The first element or the default null ID.
         """
 
         if x is None:
@@ -137,7 +302,7 @@ class GSynoX():
                     return self.default_null_id
             
         
-    def __translate_preferred_id(self, id:str, db:str, domain:str, preferred_ids:list) -> list:
+    def __translate_preferred_id(self, id:str, table:dict, preferred_ids:set) -> list | str:
         """
         Translate a single ID with prioritization of preferred IDs.
 
@@ -145,30 +310,23 @@ class GSynoX():
         -----------
         id : str
             The ID to be translated.
-        db : str
-            External database name involved in the translation.
-        domain : str
-            Defines the translation direction.
-        preferred_ids : list
-            List of IDs to prioritize during translation.
+        table : dict
+            The translation table of the database and domain involved.
+        preferred_ids : set
+            Set of IDs to prioritize during translation.
 
         Returns:
         --------
-        list
-            A list of translated IDs or the default null ID if not found.
+        list | str
+            A list with the translated IDs that are preferred, the first translated ID if none of 
+            them is preferred, or the default null ID if not found.
         """
         
-        if id in self.master[db][domain]:
-            self.master[db][domain][id]
-            tids = self.master[db][domain][id]
-            cross = [tid in preferred_ids for tid in tids]
-            matches = np.where(cross)[0]
-            if len(matches) == 0:
-                return tids[0]
-            else:
-                return [tids[x] for x in matches]
-        else:
+        tids = table.get(id)
+        if tids is None:
             return self.default_null_id
+        matches = [tid for tid in tids if tid in preferred_ids]
+        return matches if matches else tids[0]
 
     
     # cross ids
@@ -199,6 +357,37 @@ class GSynoX():
         return self.symbol_to_id(ss, db=db2, preferred_ids=preferred_ids, select_one=select_one)
     
 
+    def translate_many(self, ids, db:str, domain:str, select_one=False, preferred_ids=[]) -> "pd.Series":
+        """
+        Translate a batch of IDs to/from a given database, keeping the result aligned with the input.
+
+        Parameters:
+        -----------
+        ids : pd.Series | np.ndarray | list
+            IDs to be translated.
+        db : str
+            External database name involved in the translation (e.g., 'ensembl_gene').
+        domain : str
+            Defines the translation direction (e.g., 'symbol_to_id', 'id_to_symbol').
+        select_one : bool, optional
+            If True, selects the first translation result (default is False).
+        preferred_ids : list, optional
+            A list of IDs to prioritize during translation (default is empty).
+
+        Returns:
+        --------
+        pd.Series
+            The translated IDs, one per input ID. The index and name of a Series input are kept.
+        """
+        
+        import pandas as pd
+        
+        tx = self.__translate_all(ids, self.master[db][domain], select_one=select_one, preferred_ids=preferred_ids)
+        if isinstance(ids, pd.Series):
+            return pd.Series(tx, index=ids.index, name=ids.name, dtype=object)
+        return pd.Series(tx, dtype=object)
+    
+
     # Shortcuts
        
     def id_to_symbol(self, ids:list, db:str, preferred_ids=[], all_synonyms=False) -> list:
@@ -219,7 +408,7 @@ class GSynoX():
         Returns:
         --------
         list
-            A list of translated symbols.
+            A list of translated symbols, or of tuples with all the synonyms if `all_synonyms` is True.
         """
         
         if all_synonyms is True or len(preferred_ids)>0:
@@ -271,7 +460,7 @@ class GSynoX():
         Returns:
         --------
         list
-            A list of translated symbols.
+            A list of translated symbols, or of tuples with all the synonyms if `all_synonyms` is True.
         """
         
         return self.id_to_symbol(ids, "ensembl_gene", preferred_ids=preferred_ids, all_synonyms=all_synonyms)
@@ -313,7 +502,7 @@ class GSynoX():
         Returns:
         --------
         list
-            A list of translated symbols.
+            A list of translated symbols, or of tuples with all the synonyms if `all_synonyms` is True.
         """
         
         return self.id_to_symbol(ids, "entrez", preferred_ids=preferred_ids, all_synonyms=all_synonyms)
@@ -355,7 +544,7 @@ class GSynoX():
         Returns:
         --------
         list
-            A list of translated symbols.
+            A list of translated symbols, or of tuples with all the synonyms if `all_synonyms` is True.
         """
         
         return self.id_to_symbol(ids, "uniprot", preferred_ids=preferred_ids, all_synonyms=all_synonyms)
@@ -396,7 +585,7 @@ class GSynoX():
         Returns:
         --------
         list
-            A list of translated symbols.
+            A list of translated symbols, or of tuples with all the synonyms if `all_synonyms` is True.
         """
         
         return self.id_to_symbol(ids, "hgnc", preferred_ids=preferred_ids, all_synonyms=all_synonyms)
@@ -451,7 +640,7 @@ class GSynoX():
         Returns:
         --------
         list
-            A list of lists containing synonyms for each ID.
+            A list of tuples containing synonyms for each ID.
         """
         return self.__translate(ids, "symbol", "synonyms", select_one=False)
     
@@ -487,7 +676,10 @@ class GSynoX():
             A list of random gene symbols.
         """
         
-        official_symbols = list(self.master["symbol"]["official"].values())
+        official = self.master["symbol"]["official"]
+        if self.__random_pool is None or self.__random_pool[0] is not official:
+            self.__random_pool = (official, tuple(dict.fromkeys(official.values())))
+        official_symbols = self.__random_pool[1]
         indexes = np.random.randint(0, len(official_symbols), n)
         return [official_symbols[i] for i in indexes]
     
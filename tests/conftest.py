@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from gsynox.builder import Builder
+
+
+# A small HGNC-like table: ABCB1 has TP53 (an official symbol) as alias, and OLD1 
+# appears both as alias and previous symbol of TP53
+HGNC = (
+    "hgnc_id\tsymbol\talias_symbol\tprev_symbol\tentrez_id\tensembl_gene_id\n"
+    "HGNC:7553\tMYC\tMYCC|c-Myc\t\t4609\tENSG00000136997\n"
+    "HGNC:11998\tTP53\tp53|OLD1\tOLD1|LFS1\t7157\tENSG00000141510\n"
+    "HGNC:5\tA1BG\t\t\t1\t\n"
+    "HGNC:40\tABCB1\tTP53|PGY1\t\t5243\tENSG00000085563|ENSG00000999999\n"
+)
+
+TOY_DB = (
+    "symbol\texternal\n"
+    "MYC\ta,b,c\n"
+    "p53\td\n"
+    "A1BG\t\n"
+)
+
+
+@pytest.fixture
+def hgnc_file(tmp_path):
+    path = tmp_path / "hgnc.tsv"
+    path.write_text(HGNC)
+    return str(path)
+
+
+@pytest.fixture
+def toy_db_file(tmp_path):
+    path = tmp_path / "toy_db.tsv"
+    path.write_text(TOY_DB)
+    return str(path)
+
+
+@pytest.fixture
+def builder(hgnc_file, toy_db_file):
+    b = Builder()
+    b.build(hgnc_file)
+    b.add_db(toy_db_file, "toy")
+    return b
+
+
+@pytest.fixture
+def master_file(builder, tmp_path):
+    path = str(tmp_path / "master.pkl")
+    builder.save(path)
+    return path
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from gsynox.builder import Builder
+
+
+def test_build_info(builder):
+    assert builder.master["info"]["dbs"] == ["symbol", "ensembl_gene", "entrez", "hgnc", "toy"]
+    assert len(builder.master["info"]["log"]) == 1
+
+
+def test_build_official(builder):
+    assert builder.master["symbol"]["official"] == {
+        "MYC": "MYC", "MYCC": "MYC", "c-Myc": "MYC",
+        "TP53": "TP53", "LFS1": "TP53", "OLD1": "TP53", "p53": "TP53",
+        "A1BG": "A1BG",
+        # TP53 is an alias of ABCB1, but it is also an official symbol
+        "ABCB1": "ABCB1", "PGY1": "ABCB1",
+    }
+
+
+def test_build_synonyms(builder):
+    assert builder.master["symbol"]["synonyms"] == {
+        "MYC": ("MYCC", "c-Myc"),
+        "TP53": ("LFS1", "OLD1", "p53"),
+        "A1BG": (),
+        "ABCB1": ("PGY1", "TP53"),
+    }
+
+
+def test_build_symbol_to_id(builder):
+    assert builder.master["ensembl_gene"]["symbol_to_id"] == {
+        "MYC": ["ENSG00000136997"], "MYCC": ["ENSG00000136997"], "c-Myc": ["ENSG00000136997"],
+        "TP53": ["ENSG00000141510"], "LFS1": ["ENSG00000141510"], "OLD1": ["ENSG00000141510"], "p53": ["ENSG00000141510"],
+        "ABCB1": ["ENSG00000085563", "ENSG00000999999"], "PGY1": ["ENSG00000085563", "ENSG00000999999"],
+    }
+    assert builder.master["entrez"]["symbol_to_id"]["TP53"] == ["7157"]
+    assert builder.master["hgnc"]["symbol_to_id"]["A1BG"] == ["HGNC:5"]
+
+
+def test_build_id_to_symbol(builder):
+    assert builder.master["ensembl_gene"]["id_to_symbol"] == {
+        "ENSG00000136997": "MYC",
+        "ENSG00000141510": "TP53",
+        "ENSG00000085563": "ABCB1",
+        "ENSG00000999999": "ABCB1",
+    }
+    assert builder.master["ensembl_gene"]["id_to_all_symbols"] == {
+        "ENSG00000136997": ("MYC", "MYCC", "c-Myc"),
+        "ENSG00000141510": ("TP53", "LFS1", "OLD1", "p53"),
+        "ENSG00000085563": ("ABCB1", "PGY1", "TP53"),
+        "ENSG00000999999": ("ABCB1", "PGY1", "TP53"),
+    }
+
+
+def test_add_db(builder):
+    assert builder.master["toy"]["symbol_to_id"] == {
+        "MYC": ["a", "b", "c"], "MYCC": ["a", "b", "c"], "c-Myc": ["a", "b", "c"],
+        "TP53": ["d"], "LFS1": ["d"], "OLD1": ["d"], "p53": ["d"],
+    }
+    assert builder.master["toy"]["id_to_symbol"] == {"a": "MYC", "b": "MYC", "c": "MYC", "d": "TP53"}
+    assert builder.master["toy"]["id_to_all_symbols"]["d"] == ("TP53", "LFS1", "OLD1", "p53")
+
+
+def test_build_custom_fields(hgnc_file):
+    b = Builder()
+    b.build(hgnc_file, fields=["entrez_id"])
+    assert b.master["info"]["dbs"] == ["symbol", "entrez"]
+    assert b.master["entrez"]["id_to_symbol"] == {"4609": "MYC", "7157": "TP53", "1": "A1BG", "5243": "ABCB1"}
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+
+from gsynox import GSynoX
+from gsynox.builder import Builder
+
+
+def test_uniprot_to_symbol_with_preferred_ids():
+    g = GSynoX()
+    assert g.uniprot_to_symbol(["P04637", "X"], preferred_ids=["TP53"]) == ["TP53", None]
+
+
+def test_uniprot_to_symbol_all_synonyms_is_flat():
+    g = GSynoX()
+    assert g.uniprot_to_symbol("P04637", all_synonyms=True) == ("TP53", "LFS1", "p53")
+
+
+def test_master_file_is_reloaded_when_rewritten(builder, master_file):
+    g = GSynoX(master_file)
+    assert "toy" in g.get_info()["dbs"]
+
+    # a different size invalidates the cached master
+    del builder.master["toy"]
+    builder.master["info"] = dict(builder.master["info"], dbs=builder.master["info"]["dbs"][:-1])
+    builder.save(master_file)
+    assert "toy" not in GSynoX(master_file).get_info()["dbs"]
+
+    # so does a different modification time
+    stat = os.stat(master_file)
+    cached = GSynoX(master_file).master["symbol"]
+    os.utime(master_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert GSynoX(master_file).master["symbol"] is not cached
+
+
+def test_clear_cache(master_file):
+    g1 = GSynoX(master_file)
+    g2 = GSynoX(master_file)
+    assert g2.master is not g1.master
+    assert g2.master["symbol"] is g1.master["symbol"]
+
+    GSynoX.clear_cache()
+    assert GSynoX(master_file).master["symbol"] is not g1.master["symbol"]
+
+
+def test_cache_false_gives_an_independent_master(master_file):
+    g1 = GSynoX(master_file)
+    g1.master["symbol"]["official"]["ZZZ"] = "MYC"
+
+    assert GSynoX(master_file, cache=False).official_symbol("ZZZ") is None
+
+
+def test_add_db_does_not_leak_into_other_objects(master_file, toy_db_file):
+    g = GSynoX(master_file)
+    b = Builder()
+    b.master = g.master
+    b.add_db(toy_db_file, "extra")
+
+    assert g.symbol_to_id("MYC", "extra", select_one=False) == ["a", "b", "c"]
+    assert "extra" not in GSynoX(master_file).master
+    assert "extra" not in GSynoX(master_file).get_info()["dbs"]
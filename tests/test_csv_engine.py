@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+
+import pytest
+
+import gsynox.builder
+from gsynox.builder import Builder
+
+pytest.importorskip("pyarrow")
+
+ANNOTS = os.path.join(os.path.dirname(__file__), "..", "annots")
+
+
+def build(monkeypatch, engine):
+    monkeypatch.setattr(gsynox.builder, "_CSV_ENGINE", engine)
+    b = Builder()
+    b.build(os.path.join(ANNOTS, "hgnc_complete_set.txt"))
+    b.add_db(os.path.join(ANNOTS, "uniprot_biomart.tsv"), "uniprot")
+    del b.master["info"]
+    return b.master
+
+
+def test_pyarrow_and_c_engines_build_the_same_master(monkeypatch):
+    assert build(monkeypatch, "pyarrow") == build(monkeypatch, "c")
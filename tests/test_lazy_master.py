@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import pickle
+
+import pytest
+
+import gsynox.core
+from gsynox import GSynoX
+from gsynox.core import LazyMaster
+
+
+@pytest.fixture
+def master_dir(builder, tmp_path):
+    path = str(tmp_path / "master")
+    builder.save_sections(path)
+    return path
+
+
+@pytest.fixture
+def loaded_files(monkeypatch):
+    loaded = []
+    load = pickle.load
+
+    def spy(f):
+        loaded.append(os.path.basename(f.name))
+        return load(f)
+
+    monkeypatch.setattr(gsynox.core.pickle, "load", spy)
+    return loaded
+
+
+def test_save_sections_writes_one_file_per_section(builder, master_dir):
+    assert sorted(os.listdir(master_dir)) == sorted(f"{key}.pkl" for key in builder.master)
+
+
+def test_sections_are_loaded_on_first_access(master_dir, loaded_files):
+    g = GSynoX(master_dir, cache=False)
+    assert isinstance(g.master, LazyMaster)
+    assert loaded_files == ["info.pkl"]
+
+    assert g.symbol_to_ensembl_gene("MYC") == "ENSG00000136997"
+    assert loaded_files == ["info.pkl", "ensembl_gene.pkl"]
+
+
+def test_membership_does_not_load_sections(master_dir, loaded_files):
+    g = GSynoX(master_dir, cache=False)
+    assert "toy" in g.master
+    assert "x" not in g.master
+    assert loaded_files == ["info.pkl"]
+
+
+def test_sections_keep_the_original_order(builder, master_dir):
+    g = GSynoX(master_dir)
+    assert list(g.master) == list(builder.master)
+    assert dict(g.master) == builder.master
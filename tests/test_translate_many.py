@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gsynox import GSynoX
+
+
+@pytest.fixture
+def g(master_file):
+    return GSynoX(master_file)
+
+
+def test_series_keeps_index_and_name(g):
+    ids = pd.Series(["MYC", "NOPE", "p53"], index=[10, 20, 30], name="genes")
+    tx = g.translate_many(ids, "ensembl_gene", "symbol_to_id", select_one=True)
+
+    assert tx.index.tolist() == [10, 20, 30]
+    assert tx.name == "genes"
+    assert tx.tolist() == ["ENSG00000136997", None, "ENSG00000141510"]
+
+
+def test_list_returns_series(g):
+    tx = g.translate_many(["MYC", "A1BG"], "symbol", "synonyms")
+    assert isinstance(tx, pd.Series)
+    assert tx.tolist() == [("MYCC", "c-Myc"), ()]
+
+
+def test_select_one(g):
+    ids = ["ABCB1"]
+    assert g.translate_many(ids, "ensembl_gene", "symbol_to_id").tolist() == [["ENSG00000085563", "ENSG00000999999"]]
+    assert g.translate_many(ids, "ensembl_gene", "symbol_to_id", select_one=True).tolist() == ["ENSG00000085563"]
+
+
+def test_preferred_ids(g):
+    tx = g.translate_many(["ABCB1", "MYC", "NOPE"], "ensembl_gene", "symbol_to_id", preferred_ids=["ENSG00000999999"])
+    assert tx.tolist() == [["ENSG00000999999"], "ENSG00000136997", None]
+
+
+def test_shortcuts_keep_series_and_arrays(g):
+    tx = g.symbol_to_ensembl_gene(pd.Series(["MYC"], index=["a"]))
+    assert isinstance(tx, pd.Series)
+    assert tx.to_dict() == {"a": "ENSG00000136997"}
+
+    # a single-element array is not unwrapped to a scalar
+    tx = g.symbol_to_ensembl_gene(np.array(["MYC"]))
+    assert isinstance(tx, np.ndarray)
+    assert tx.tolist() == ["ENSG00000136997"]
+
+    tx = g.ensembl_gene_to_symbol(np.array(["ENSG00000141510", "ENSG00000085563"]), preferred_ids=["p53"])
+    assert isinstance(tx, np.ndarray)
+    assert tx.tolist() == ["p53", "ABCB1"]